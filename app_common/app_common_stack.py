@@ -5,19 +5,24 @@ The stack also creates an SSM parameter to store the ErrorHandlingTopic ARN.
 This can be used as a base class for other utility features to be added to a stack.
 """
 
+from typing import TYPE_CHECKING
+
 import jsii
 from aws_cdk import Aspects, Duration, IAspect, RemovalPolicy, Stack
-from aws_cdk import aws_dynamodb as dynamodb
-from aws_cdk import aws_events as events
 from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as _lambda
 from aws_cdk import aws_logs as logs
-from aws_cdk import aws_sns as sns
 from aws_cdk import aws_ssm as ssm
 from constructs import Construct, IConstruct
 
 from app_common.app_utils import _do_log
 
+if TYPE_CHECKING:
+    # Only used for type hints: the DynamoDB, EventBridge and SNS modules are large
+    # and not needed by every stack, so they are imported where actually used
+    from aws_cdk import aws_dynamodb as dynamodb
+    from aws_cdk import aws_sns as sns
+
 
 @jsii.implements(IAspect)
 class GrantPublishToCustomEventBusAspect:
@@ -28,6 +33,39 @@ class GrantPublishToCustomEventBusAspect:
 
     def __init__(self, custom_event_bus_name: str) -> None:
         self.custom_event_bus_name = custom_event_bus_name
+        # A single managed policy per stack, shared by all the Lambda roles in it,
+        # keeps the synthesized template from growing with the number of Lambdas
+        self._publish_policies = {}
+
+    def _create_publish_statement(self, stack: Stack) -> iam.PolicyStatement:
+        """
+        Creates the policy statement that allows publishing to the custom event bus.
+        """
+        return iam.PolicyStatement(
+            effect=iam.Effect.ALLOW,
+            actions=["events:PutEvents"],
+            resources=[
+                f"arn:aws:events:{stack.region}:{stack.account}"
+                f":event-bus/{self.custom_event_bus_name}"
+            ],
+        )
+
+    def _get_publish_policy(self, stack: Stack) -> iam.ManagedPolicy:
+        """
+        Returns the managed policy that allows publishing to the custom event bus,
+        creating it in the given stack the first time it is requested.
+        """
+        policy = self._publish_policies.get(stack.node.addr)
+
+        if policy is None:
+            policy = iam.ManagedPolicy(
+                stack,
+                f"{self.custom_event_bus_name}PublishPolicy",
+                statements=[self._create_publish_statement(stack)],
+            )
+            self._publish_policies[stack.node.addr] = policy
+
+        return policy
 
     def visit(self, node: IConstruct) -> None:
         """
@@ -36,20 +74,31 @@ class GrantPublishToCustomEventBusAspect:
         """
         if isinstance(node, _lambda.Function):
             _do_log(
-                obj=f"Granting publish permissions to Lambda: {node.function_name} "
-                f"to publish messages on the {self.custom_event_bus_name} event bus"
-            )
-            node.add_to_role_policy(
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=["events:PutEvents"],
-                    resources=[
-                        f"arn:aws:events:{Stack.of(node).region}"
-                        f":{Stack.of(node).account}"
-                        f":event-bus/{self.custom_event_bus_name}"
-                    ],
+                msg_factory=lambda: (
+                    f"Granting publish permissions to Lambda: {node.function_name} "
+                    f"to publish messages on the {self.custom_event_bus_name} event bus"
                 )
             )
+            stack = Stack.of(node)
+            role = node.role
+            if (
+                isinstance(role, iam.Role)
+                and Stack.of(role).node.addr == stack.node.addr
+            ):
+                # attach_to_role() ignores roles already attached (shared roles)
+                policy = self._get_publish_policy(stack)
+                policy.attach_to_role(role)
+                # Attaching the policy adds no dependency from the function, which
+                # could otherwise be created or updated before the policy grants
+                # access. Only the function resource depends on it: its role is
+                # referenced by the policy, so making the whole construct depend
+                # on it would be circular
+                node.node.default_child.node.add_dependency(policy)
+            else:
+                # Roles not owned by this stack are granted through
+                # add_to_role_policy(), which leaves immutable roles alone and
+                # takes none of their managed policy slots
+                node.add_to_role_policy(self._create_publish_statement(stack))
             # Add the custom event bus name as a environment variable
             node.add_environment("CUSTOM_EVENT_BUS_NAME", self.custom_event_bus_name)
 
@@ -63,9 +112,10 @@ class AppCommonStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
-        if self._get_custom_event_bus_name():
+        custom_event_bus_name = self._get_custom_event_bus_name()
+        if custom_event_bus_name:
             Aspects.of(self).add(
-                GrantPublishToCustomEventBusAspect(self._get_custom_event_bus_name())
+                GrantPublishToCustomEventBusAspect(custom_event_bus_name)
             )
 
     def _get_default_param_custom_path(self):
@@ -92,13 +142,9 @@ class AppCommonStack(Stack):
         # Use the custom path or default to the stack name
         custom_path = custom_path or self._get_default_param_custom_path()
 
-        if custom_path.startswith("/"):
-            # Remove the leading slash
-            custom_path = custom_path[1:]
-
-        if parameter_name.startswith("/"):
-            # Remove the leading slash
-            parameter_name = parameter_name[1:]
+        # Remove the leading slashes
+        custom_path = custom_path.removeprefix("/")
+        parameter_name = parameter_name.removeprefix("/")
 
         # Construct the full parameter name
         full_parameter_name = f"/{custom_path}/{parameter_name}"
@@ -124,12 +170,14 @@ class AppCommonStack(Stack):
         allow_event_bus_publish_on=True,
         **kwargs,
     ):
+        from aws_cdk.aws_sns import Topic
+
         topic = None
 
         if fifo:
             # create a FIFO SNS topic
             topic_name = f"{topic_name}.fifo"
-            topic = sns.Topic(
+            topic = Topic(
                 self,
                 id=topic_name,
                 topic_name=topic_name,
@@ -140,7 +188,7 @@ class AppCommonStack(Stack):
                 **kwargs,
             )
         else:
-            topic = sns.Topic(
+            topic = Topic(
                 self,
                 id=topic_name,
                 topic_name=topic_name,
@@ -178,9 +226,8 @@ class AppCommonStack(Stack):
         :param lambda_function: The Lambda function to grant access.
         :param parameter_full_path: The full path of the SSM parameter.
         """
-        if param_full_path.startswith("/"):
-            # Remove the leading "/" if present
-            param_full_path = param_full_path[1:]
+        # Remove the leading "/" if present
+        param_full_path = param_full_path.removeprefix("/")
 
         lambda_function.add_to_role_policy(
             iam.PolicyStatement(
@@ -222,6 +269,7 @@ class AppCommonStack(Stack):
         duration_seconds: int = 30,
         from_asset: str = "lambdas",
         runtime=_lambda.Runtime.PYTHON_3_11,
+        architecture=_lambda.Architecture.X86_64,
         log_retention=logs.RetentionDays.THREE_MONTHS,
         **kwargs,
     ) -> _lambda.Function:
@@ -229,6 +277,10 @@ class AppCommonStack(Stack):
         Utility method to create a Lambda function with the specified configuration.
         Ensures the Lambda's log group retention policy is set
         according with the log_retention parameter.
+
+        Use ``architecture=_lambda.Architecture.ARM_64`` to run on Graviton, which
+        is cheaper per GB-second; just make sure any native dependencies packaged
+        with the Lambda were built for ARM.
         """
         # Create the Lambda function
         lambda_obj = _lambda.Function(
@@ -236,6 +288,7 @@ class AppCommonStack(Stack):
             name,
             function_name=f"{self.stack_name}-{name}",
             runtime=runtime,
+            architecture=architecture,
             handler=handler,
             code=_lambda.Code.from_asset(from_asset),
             environment=environment,
@@ -252,40 +305,42 @@ class AppCommonStack(Stack):
         )
 
         self.do_log(
-            f"Created Lambda function {name} with a "
-            f"{log_retention} log retention policy."
+            msg_factory=lambda: (
+                f"Created Lambda function {name} with a "
+                f"{log_retention} log retention policy."
+            )
         )
 
         return lambda_obj
 
     @staticmethod
-    def do_log(obj, title: str = None):
+    def do_log(obj=None, title: str = None, msg_factory=None):
         """
         Utility method to log an object.
         """
-        _do_log(obj=obj, title=title)
+        _do_log(obj=obj, title=title, msg_factory=msg_factory)
 
     def _create_dynamodb_table(
         self,
         table_name: str,
         pk_name: str,
-        pk_type: dynamodb.AttributeType,
+        pk_type: "dynamodb.AttributeType",
         sk_name: str = None,
-        sk_type: dynamodb.AttributeType = None,
+        sk_type: "dynamodb.AttributeType" = None,
         removal_policy: RemovalPolicy = RemovalPolicy.RETAIN,
         **kwargs,
-    ) -> dynamodb.Table:
+    ) -> "dynamodb.Table":
         """
         Creates a DynamoDB table with the specified parameters.
         """
-        new_table = dynamodb.Table(
+        from aws_cdk.aws_dynamodb import Attribute, Table
+
+        new_table = Table(
             self,
             table_name,
-            partition_key=dynamodb.Attribute(name=pk_name, type=pk_type),
+            partition_key=Attribute(name=pk_name, type=pk_type),
             sort_key=(
-                dynamodb.Attribute(name=sk_name, type=sk_type)
-                if sk_name and sk_type
-                else None
+                Attribute(name=sk_name, type=sk_type) if sk_name and sk_type else None
             ),
             table_name=table_name,
             removal_policy=removal_policy,
@@ -312,9 +367,11 @@ class AppCommonStack(Stack):
         if not custom_event_bus_name:
             return None
         # else:
+        from aws_cdk.aws_events import EventBus
+
         self.do_log(f"Creating EventBus: {custom_event_bus_name}")
         # Create the EventBus
-        custom_event_bus = events.EventBus(
+        custom_event_bus = EventBus(
             self,
             custom_event_bus_name,
             event_bus_name=custom_event_bus_name,
@@ -324,7 +381,9 @@ class AppCommonStack(Stack):
 
         return custom_event_bus
 
-    def _import_sns_topic(self, topic_name: str) -> sns.ITopic:
+    def _import_sns_topic(self, topic_name: str) -> "sns.ITopic":
         """Imports an existing SNS topic by name."""
+        from aws_cdk.aws_sns import Topic
+
         topic_arn = f"arn:aws:sns:{self.region}:{self.account}:{topic_name}"
-        return sns.Topic.from_topic_arn(self, topic_name, topic_arn)
+        return Topic.from_topic_arn(self, topic_name, topic_arn)
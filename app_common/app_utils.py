@@ -4,9 +4,20 @@ General-purpose utilities.
 
 import decimal
 import json
-import subprocess
+import os
+import re
 import sys
 import time
+from functools import lru_cache
+from itertools import chain
+from typing import Callable
+from urllib.parse import urlencode
+
+try:
+    # Optional faster JSON parser, used when installed
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class DecimalEncoder(json.JSONEncoder):
@@ -14,8 +25,9 @@ class DecimalEncoder(json.JSONEncoder):
     Utility class to encode `decimal.Decimal` objects as strings.
     """
 
-    def default(self, o):
-        if isinstance(o, decimal.Decimal):
+    def default(self, o, _decimal=decimal.Decimal):
+        # `_decimal` is bound once, so the check does not look up the module
+        if isinstance(o, _decimal):
             return str(o)
         return super().default(o)
 
@@ -26,9 +38,7 @@ def get_first_non_none(*args, **kwargs):
     exists.
     """
 
-    return next(
-        (arg for arg in list(args) + list(kwargs.values()) if arg is not None), None
-    )
+    return next((arg for arg in chain(args, kwargs.values()) if arg is not None), None)
 
 
 def get_first_element(lst: list):
@@ -50,11 +60,10 @@ def str_is_none_or_empty(s) -> bool:
 
     if s is None:
         return True
-    if isinstance(s, str):
-        return s.strip() == ""
-    if str(s).strip() == "":
-        return True
-    return False
+    if not isinstance(s, str):
+        s = str(s)
+    # Same as `s.strip() == ""`, without allocating a stripped copy
+    return not s or s.isspace()
 
 
 def is_numeric(x) -> bool:
@@ -67,6 +76,15 @@ def is_numeric(x) -> bool:
     if x is None:
         return False
 
+    # Fast path for the most common numeric types
+    if type(x) is int or type(x) is float:
+        return True
+
+    # Short strings tend to repeat (e.g. the same fields), so their result is
+    # cached; longer ones (e.g. message bodies) would only fill up the cache
+    if isinstance(x, str) and len(x) <= _STR_IS_NUMERIC_CACHE_MAX_LEN:
+        return _str_is_numeric(x)
+
     try:
         float(x)
         return True
@@ -74,21 +92,160 @@ def is_numeric(x) -> bool:
         return False
 
 
+# Strings longer than this are not cached by `_str_is_numeric`
+_STR_IS_NUMERIC_CACHE_MAX_LEN = 64
+
+
+@lru_cache(maxsize=4096)
+def _str_is_numeric(s: str) -> bool:
+    """
+    Returns `True` in case the input string represents a number.
+    """
+
+    try:
+        float(s)
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=16)
+def _get_json_encoder(cls, indent) -> json.JSONEncoder:
+    """
+    Returns a shared encoder for the given class and indentation, instead of
+    building a new one on every call as `json.dumps(..., cls=cls)` does.
+    """
+    return cls(indent=indent)
+
+
 def json_dumps(data, indent=4, cls=DecimalEncoder) -> str:
     """
     Utility method to serialize data to JSON, including Decimal values.
     """
-    return json.dumps(data, indent=indent, cls=cls)
+    return _get_json_encoder(cls, indent).encode(data)
+
+
+# Runs of 19 digits or more may be integers that do not fit in 64 bits
+_LONG_DIGITS_STR = re.compile(r"[0-9]{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"[0-9]{19}")
+
+
+def json_loads(data):
+    """
+    Utility method to parse JSON from a string or bytes, giving the same result
+    as `json.loads`. The faster `orjson` is used when it is installed, except for
+    the input it parses differently: integers beyond 64 bits, which it turns
+    into floats, and `NaN`/`Infinity`, which it rejects. Such input is left to
+    the `json` module instead. Invalid input raises a `json.JSONDecodeError`.
+    """
+    if orjson is not None:
+        long_digits = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS_BYTES
+        if long_digits.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Either json.loads() accepts it as well, or it raises the same
+                pass
+    return json.loads(data)
+
+
+# Numeric values of the levels accepted by the `LOG_LEVEL` environment variable,
+# including the `WARN` and `FATAL` aliases of the `logging` module
+_LOG_LEVELS = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARN": 30,
+    "WARNING": 30,
+    "ERROR": 40,
+    "FATAL": 50,
+    "CRITICAL": 50,
+}
+# Unknown `LOG_LEVEL` values already reported, so that each is reported once
+_unknown_log_levels = set()
+
+
+def is_logging_enabled(level: str = "INFO") -> bool:
+    """
+    Returns `True` in case messages of the given level should be logged,
+    according to the `LOG_LEVEL` environment variable. Everything is logged
+    when the variable is not set or holds an unknown level.
+    """
+    threshold = os.environ.get("LOG_LEVEL", "DEBUG").upper()
+    threshold_value = _LOG_LEVELS.get(threshold)
+
+    if threshold_value is None:
+        if threshold not in _unknown_log_levels:
+            _unknown_log_levels.add(threshold)
+            print(f"Unknown LOG_LEVEL {threshold!r}, logging everything")
+        threshold_value = _LOG_LEVELS["DEBUG"]
+
+    return _LOG_LEVELS.get(level, 20) >= threshold_value
+
+
+def _truncate(value, limit):
+    """
+    Truncates a string or value to the specified limit,
+    adding ellipsis if truncated.
+
+    Args:
+        value: The value to truncate. Can be a string, int, or float.
+        limit (int): Maximum length of the string.
+
+    Returns:
+        str: The truncated value as a string.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if not isinstance(value, str):
+        value = str(value)  # Ensure the input is a string
+    return value if len(value) <= limit else value[:limit] + "..."
+
+
+def _process_log_obj(obj, deep, deep_limit, line_len_limit, list_sample_size):
+    """
+    Recursively processes objects (dicts and lists) into a flat
+    representation with truncation.
+
+    Args:
+        obj: The object to process (can be a dict, list, or other type).
+        deep (int): Current depth of recursion.
+        deep_limit (int): Maximum depth for processing nested structures.
+        line_len_limit (int): Maximum length for any single value.
+        list_sample_size (int): Number of list elements to keep.
+
+    Returns:
+        The processed object with truncation applied.
+    """
+    if deep >= deep_limit:
+        return _truncate(obj, line_len_limit)
+
+    deep += 1
+    if isinstance(obj, dict):
+        return {
+            k: _process_log_obj(v, deep, deep_limit, line_len_limit, list_sample_size)
+            for k, v in obj.items()
+        }
+    elif isinstance(obj, list):
+        truncated_list = [
+            _process_log_obj(v, deep, deep_limit, line_len_limit, list_sample_size)
+            for v in obj[:list_sample_size]
+        ]
+        if len(obj) > list_sample_size:
+            truncated_list.append(f"<...and {len(obj) - list_sample_size} more>")
+        return truncated_list
+    return _truncate(obj, line_len_limit)
 
 
 def _do_log(
-    obj,
+    obj=None,
     title=None,
     line_len_limit: int = 100,
     line_break_chars: str = " ",
     list_sample_size: int = 5,
     json_indent: int = 4,
     deep_limit: int = 3,
+    level: str = "INFO",
+    msg_factory: Callable[[], str] = None,
 ):
     """
     Logs an object to the console in a single entry, truncating long values
@@ -103,53 +260,23 @@ def _do_log(
         list_sample_size (int): Number of list elements to display before truncating.
         json_indent (int): Indentation level for JSON formatting.
         deep_limit (int): Maximum depth for processing nested structures.
+        level (str): Level of the message, checked against `LOG_LEVEL`.
+        msg_factory (callable, optional): A zero-argument function returning the
+            object to log, used instead of `obj`. Expensive messages are then
+            only built when the log is emitted.
     """
 
-    def truncate(value, limit):
-        """
-        Truncates a string or value to the specified limit,
-        adding ellipsis if truncated.
+    if not is_logging_enabled(level):
+        return
 
-        Args:
-            value: The value to truncate. Can be a string, int, or float.
-            limit (int): Maximum length of the string.
-
-        Returns:
-            str: The truncated value as a string.
-        """
-        if isinstance(value, (int, float)) and not isinstance(value, bool):
-            return value
-        value = str(value)  # Ensure the input is a string
-        if len(value) > limit:
-            return value[:limit] + "..."
-        return value
-
-    def process(obj, deep=1):
-        """
-        Recursively processes objects (dicts and lists) into a flat
-        representation with truncation.
-
-        Args:
-            obj: The object to process (can be a dict, list, or other type).
-            deep (int): Current depth of recursion.
-
-        Returns:
-            The processed object with truncation applied.
-        """
-        if deep >= deep_limit:
-            return truncate(obj, line_len_limit)
-
-        if isinstance(obj, dict):
-            return {k: process(v, deep + 1) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            truncated_list = [process(v, deep + 1) for v in obj[:list_sample_size]]
-            if len(obj) > list_sample_size:
-                truncated_list.append(f"<...and {len(obj) - list_sample_size} more>")
-            return truncated_list
-        return truncate(obj, line_len_limit)
+    # Build the object lazily, if a message factory was given
+    if msg_factory is not None:
+        obj = msg_factory()
 
     # Process the object
-    processed_obj = process(obj)
+    processed_obj = _process_log_obj(
+        obj, 1, deep_limit, line_len_limit, list_sample_size
+    )
 
     # Prepare the log message as a JSON string, if necessary
     log_message = ""
@@ -169,6 +296,18 @@ def _do_log(
     print(log_message)
 
 
+@lru_cache(maxsize=1)
+def _get_pool_manager():
+    """
+    Returns the urllib3 pool manager shared by `http_request`, so that
+    connections are kept alive and reused across requests.
+    """
+    # It's necessary keep this import here to avoid circular dependencies
+    import urllib3  # pylint: disable=import-outside-toplevel
+
+    return urllib3.PoolManager()
+
+
 def http_request(
     method, url, headers=None, json_data=None, params=None, timeout=30, **kwargs
 ):
@@ -193,7 +332,7 @@ def http_request(
     # It's necessary keep this import here to avoid circular dependencies
     import urllib3  # pylint: disable=import-outside-toplevel
 
-    http = urllib3.PoolManager()
+    http = _get_pool_manager()
 
     if json_data is not None:
         headers = headers or {}
@@ -203,8 +342,6 @@ def http_request(
 
     # Append query parameters to the URL if provided
     if params:
-        from urllib.parse import urlencode
-
         url = f"{url}?{urlencode(params)}"
 
     response = http.request(
@@ -216,13 +353,14 @@ def http_request(
         **kwargs,
     )
 
-    response_data = response.data.decode("utf-8") if response.data else None
-
-    if response_data and response.headers.get("Content-Type", "").startswith(
-        "application/json"
-    ):
-        # If there is some parsing error, raise an exception
-        response_data = json.loads(response_data)
+    response_data = None
+    if response.data:
+        if response.headers.get("Content-Type", "").startswith("application/json"):
+            # Parse the raw bytes directly, without decoding them to a string first.
+            # If there is some parsing error, raise an exception
+            response_data = json_loads(response.data)
+        else:
+            response_data = response.data.decode("utf-8")
 
     return {
         "status": response.status,
@@ -239,6 +377,9 @@ def run_command(command, cwd=None, shell=False):
     :param cwd: The directory to run the command in.
     :param shell: Whether to use a shell to run the command.
     """
+    # Imported here, as it's only needed by the setup scripts and not by Lambdas
+    import subprocess  # pylint: disable=import-outside-toplevel
+
     # TODO: #17 Fix it getting the correct path from the user's Windows environment
     # Replace 'python3.11' with the current Python executable
     if isinstance(command, list):
@@ -2,22 +2,194 @@
 This module contains the base class for Lambda handlers.
 """
 
-import base64
 import json
 import os
-import traceback
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
 try:
-    import boto3
-except ImportError as exc:
-    raise RuntimeError(
-        "boto3 is not available; ensure it is provided by the runtime environment."
-    ) from exc
+    # Optional SIMD-accelerated decoder, used when installed
+    from pybase64 import b64decode
+except ImportError:
+    # Same as base64.b64decode(), without its Python-level wrapper
+    from binascii import a2b_base64 as b64decode
 
 from app_common import app_utils
 
+# SQS message attribute flagging message bodies compressed by send_message_to_sqs
+_CONTENT_ENCODING_ATTRIBUTE = "ContentEncoding"
+# Message bodies up to this size (in characters) are never compressed
+_COMPRESSION_MIN_SIZE = 64 * 1024
+# Limits of a single SQS send_message_batch call: number of messages, and total
+# size (in bytes) of their bodies, which is also the maximum size of one message
+_SQS_BATCH_MAX_MESSAGES = 10
+_SQS_BATCH_MAX_BYTES = 256 * 1024
+# Connections kept alive by each boto3 client; concurrent S3 transfers are sized
+# so as not to open more than this, which would discard pooled connections
+_MAX_POOL_CONNECTIONS = 50
+# Threads used by a single S3 transfer of a large file
+_S3_TRANSFER_MAX_CONCURRENCY = 16
+
+
+class SQSBatchSendError(RuntimeError):
+    """
+    Raised by ``send_messages_to_sqs()`` when some messages could not be sent.
+    Every batch is attempted before raising, so ``failed`` lists the entries
+    that were not sent (their ``Id`` is the index of the message in the list
+    given by the caller) and ``responses`` holds all the batch responses.
+    """
+
+    def __init__(self, failed: list, responses: list):
+        super().__init__(f"Failed to send {len(failed)} messages: {failed}")
+        self.failed = failed
+        self.responses = responses
+
+
+# Default total size (in bytes) of the S3 objects kept in memory by
+# download_object_from_bucket(use_cache=True); see S3_OBJECT_CACHE_MAX_BYTES
+_OBJECT_CACHE_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _ObjectCache:
+    """
+    In-memory LRU cache of S3 object contents, keyed by (bucket name, object
+    name). A lock guards it, as downloads may run on thread pools.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()  # from the least to the most recently used
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        """
+        Returns the cached contents for the given key, or ``None``.
+        """
+        with self._lock:
+            contents = self._entries.get(key)
+            if contents is not None:
+                self._entries.move_to_end(key)
+            return contents
+
+    def put(self, key: tuple, contents: bytes, max_bytes: int):
+        """
+        Caches the given contents, evicting the least recently used entries to
+        keep the total size within ``max_bytes``.
+        """
+        with self._lock:
+            self._discard(key)
+            if len(contents) > max_bytes:
+                return
+
+            self._entries[key] = contents
+            self._size += len(contents)
+            while self._size > max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def invalidate(self, key: tuple):
+        """
+        Removes the given key from the cache, if present.
+        """
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key: tuple):
+        contents = self._entries.pop(key, None)
+        if contents is not None:
+            self._size -= len(contents)
+
+
+# Being global, the cache survives warm invocations
+_object_cache = _ObjectCache()
+
+
+def _import_boto3():
+    """
+    Imports boto3 on first use. Importing it is slow and weighs on Lambda cold
+    starts, while some handlers never talk to AWS services at all.
+    """
+    try:
+        import boto3  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise RuntimeError(
+            "boto3 is not available; ensure it is provided by the runtime environment."
+        ) from exc
+
+    return boto3
+
+
+def _compress_message_body(message_body: str) -> str:
+    """
+    Compresses a message body with gzip, encoding the result as Base64 text.
+    """
+    import base64  # pylint: disable=import-outside-toplevel
+    import gzip  # pylint: disable=import-outside-toplevel
+
+    return base64.b64encode(gzip.compress(message_body.encode("utf-8"))).decode()
+
+
+def _decompress_message_body(message_body: str) -> str:
+    """
+    Reverts ``_compress_message_body()``.
+    """
+    import gzip  # pylint: disable=import-outside-toplevel
+
+    return gzip.decompress(b64decode(message_body)).decode("utf-8")
+
+
+def _get_object_cache_max_bytes() -> int:
+    """
+    Returns the maximum total size of the object cache, read from the
+    ``S3_OBJECT_CACHE_MAX_BYTES`` environment variable. Invalid values fall back
+    to the default size.
+    """
+    value = BaseLambdaHandler.get_env_var("S3_OBJECT_CACHE_MAX_BYTES")
+    if value is None:
+        return _OBJECT_CACHE_DEFAULT_MAX_BYTES
+
+    try:
+        return int(value)
+    except ValueError:
+        app_utils._do_log(
+            f"Invalid S3_OBJECT_CACHE_MAX_BYTES {value!r}, using the default size",
+            level="WARNING",
+        )
+        return _OBJECT_CACHE_DEFAULT_MAX_BYTES
+
+
+def _cache_object(cache_key: tuple, local_file_path: str):
+    """
+    Adds the contents of a downloaded object to the object cache. Objects larger
+    than the cache itself are not kept.
+    """
+    max_bytes = _get_object_cache_max_bytes()
+    if os.stat(local_file_path).st_size > max_bytes:
+        return
+
+    with open(local_file_path, "rb") as local_file:
+        _object_cache.put(cache_key, local_file.read(), max_bytes)
+
+
+def _create_client(service_name: str):
+    """
+    Creates a boto3 client for the given service. TCP keep-alive and a larger
+    connection pool let a warm container reuse its connections across calls,
+    and the standard retry mode retries transient errors with backoff.
+    """
+    boto3 = _import_boto3()
+    from botocore.config import Config  # pylint: disable=import-outside-toplevel
+
+    config = Config(
+        tcp_keepalive=True,
+        max_pool_connections=_MAX_POOL_CONNECTIONS,
+        retries={"mode": "standard", "max_attempts": 3},
+    )
+    return boto3.client(service_name, config=config)
+
 
 class BaseLambdaHandler(ABC):
     """
@@ -57,6 +229,9 @@ class BaseLambdaHandler(ABC):
         """
         Extracts error details from the exception.
         """
+        # Only needed on the error path, so it's imported here
+        import traceback  # pylint: disable=import-outside-toplevel
+
         # Extract the stack trace
         stack_trace = "".join(traceback.format_tb(exception.__traceback__))
         # Extract the error message
@@ -104,7 +279,7 @@ class BaseLambdaHandler(ABC):
         # Publish the exception on the custom event bus
         try:
             # Just print the exception.
-            self.do_log(title="Exception Found", obj=error_details)
+            self.do_log(title="Exception Found", obj=error_details, level="ERROR")
             self.publish_to_custom_event_bus(
                 message=error_details,
                 detail_type="NewExceptionRaised",
@@ -114,6 +289,7 @@ class BaseLambdaHandler(ABC):
             self.do_log(
                 title="Error while publishing to custom event bus",
                 obj={"exception": str(e)},
+                level="ERROR",
             )
 
     def _security_check(self) -> bool:
@@ -136,7 +312,7 @@ class BaseLambdaHandler(ABC):
         to be overridden by subclasses.
         """
 
-        self.do_log("Running before_handle()...")
+        self.do_log("Running before_handle()...", level="DEBUG")
 
     def _after_handle(self):
         """
@@ -146,7 +322,7 @@ class BaseLambdaHandler(ABC):
         overridden by subclasses.
         """
 
-        self.do_log("Running after_handle()...")
+        self.do_log("Running after_handle()...", level="DEBUG")
 
     @abstractmethod
     def _handle(self):
@@ -176,22 +352,25 @@ class BaseLambdaHandler(ABC):
         if self.body is not None:
             return self.body
 
-        raw_body = self.event
+        event = self.event
+        raw_body = event
 
-        if "body" in self.event:
-            raw_body = self.event["body"]
-            if self.event.get("isBase64Encoded", False):
+        if "body" in event:
+            raw_body = event["body"]
+            if event.get("isBase64Encoded", False):
                 # Decode the body if it is Base64-encoded
-                raw_body = base64.b64decode(self.event["body"])
-        elif "Records" in self.event:
-            if len(self.event["Records"]) > 0:
-                if "body" in self.event["Records"][0]:
-                    raw_body = self.event["Records"][0]["body"]
-                elif (
-                    "Sns" in self.event["Records"][0]
-                    and "Message" in self.event["Records"][0]["Sns"]
-                ):
-                    raw_body = self.event["Records"][0]["Sns"]["Message"]
+                raw_body = b64decode(raw_body)
+        elif event.get("Records"):
+            # SQS and SNS events: only the first record is considered
+            record = event["Records"][0]
+            if "body" in record:
+                raw_body = record["body"]
+                attributes = record.get("messageAttributes") or {}
+                content_encoding = attributes.get(_CONTENT_ENCODING_ATTRIBUTE) or {}
+                if content_encoding.get("stringValue") == "gzip":
+                    raw_body = _decompress_message_body(raw_body)
+            elif "Message" in record.get("Sns", {}):
+                raw_body = record["Sns"]["Message"]
 
         self.body = raw_body
 
@@ -203,7 +382,7 @@ class BaseLambdaHandler(ABC):
         # else: try to parse as json
 
         try:
-            self.body = json.loads(raw_body)
+            self.body = app_utils.json_loads(raw_body)
         except (json.JSONDecodeError, TypeError, ValueError):
             self.do_log(title="** Error parsing body as json", obj=raw_body)
             # Use raw body if not JSON
@@ -216,6 +395,10 @@ class BaseLambdaHandler(ABC):
         Logs basic information about the lambda invocation, such as the
         `event`, `context` and `body` parameters received from AWS.
         """
+        if not app_utils.is_logging_enabled("INFO"):
+            # Skip the calls altogether, as events can be large
+            return
+
         self.do_log(self.event, title="*** Event", deep_limit=1)
         self.do_log(self.context, title="*** Context", deep_limit=1)
         self.do_log(self.body, title="*** Body", deep_limit=5)
@@ -241,7 +424,7 @@ class BaseLambdaHandler(ABC):
         self.event = event
         self.context = context
         self.body = self._load_body_from_event()
-        self.headers = event["headers"] if "headers" in event else {}
+        self.headers = event.get("headers") or {}
 
         # log basic information about the lambda invocation
         self._log_basic_info()
@@ -250,7 +433,7 @@ class BaseLambdaHandler(ABC):
         job_return = None
         job_return = self._do_the_job()
 
-        self.do_log("** Finishing the lambda execution")
+        self.do_log("** Finishing the lambda execution", level="DEBUG")
 
         if isinstance(job_return, dict) and "statusCode" in job_return:
             # If the return is a response object, return it
@@ -301,7 +484,7 @@ class BaseLambdaHandler(ABC):
         Raises:
             RuntimeError: If any events fail to publish (FailedEntryCount > 0).
         """
-        eventbridge_client = boto3.client("events")
+        eventbridge_client = self._get_events_client()
 
         if not source:
             # source equal the current class name
@@ -373,11 +556,11 @@ class BaseLambdaHandler(ABC):
                 return
             # else: it is ok to proceed
             self._before_handle()
-            self.do_log("** before_handle() is done.")
+            self.do_log("** before_handle() is done.", level="DEBUG")
             self.job_return = self._handle()
-            self.do_log("** handle() is done.")
+            self.do_log("** handle() is done.", level="DEBUG")
             self._after_handle()
-            self.do_log("** after_handle() is done.")
+            self.do_log("** after_handle() is done.", level="DEBUG")
         except Exception as e:
             # an exception occurred during the processing of the lambda
             # set the job_return to the error message
@@ -428,31 +611,115 @@ class BaseLambdaHandler(ABC):
 
     @staticmethod
     def upload_to_bucket(
-        bucket_name, local_file_path, bucket_obj_name, remove_local_file=True
+        bucket_name,
+        local_file_path,
+        bucket_obj_name,
+        remove_local_file=True,
+        max_concurrency: int = _S3_TRANSFER_MAX_CONCURRENCY,
     ):
         """
         Uploads the contents of a local file to an object inside an AWS S3
-        bucket, optionally removing the local file after the upload.
+        bucket, optionally removing the local file after the upload. Large
+        files are uploaded in parts, over up to ``max_concurrency`` threads.
         """
 
-        bucket = boto3.resource("s3").Bucket(bucket_name)
-        bucket.upload_file(local_file_path, bucket_obj_name)
+        s3_client = BaseLambdaHandler._get_s3_client()
+        s3_client.upload_file(
+            local_file_path,
+            bucket_name,
+            bucket_obj_name,
+            Config=BaseLambdaHandler._get_s3_transfer_config(max_concurrency),
+        )
         if remove_local_file:
             os.remove(local_file_path)
 
     @staticmethod
-    def download_object_from_bucket(bucket_name, bucket_obj_name, local_file_path):
+    def upload_files_to_bucket(
+        bucket_name, files: list, remove_local_files=True, max_workers: int = 8
+    ):
+        """
+        Uploads several local files to objects inside an AWS S3 bucket
+        concurrently, optionally removing each local file after its upload.
+
+        Parameters:
+        - bucket_name (str): The name of the S3 bucket.
+        - files (list): Pairs of (local_file_path, bucket_obj_name).
+        - remove_local_files (bool, optional): Whether to remove the local files
+            after uploading them. Default is True.
+        - max_workers (int, optional): Maximum number of concurrent uploads.
+            Default is 8.
+        """
+        if not files:
+            return
+
+        # Create the shared client up front, so that threads don't race to do it
+        BaseLambdaHandler._get_s3_client()
+
+        # Share the client's connection pool among the uploads and their parts
+        workers = min(max_workers, len(files), _MAX_POOL_CONNECTIONS)
+        max_concurrency = min(
+            _S3_TRANSFER_MAX_CONCURRENCY, _MAX_POOL_CONNECTIONS // workers
+        )
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    BaseLambdaHandler.upload_to_bucket,
+                    bucket_name,
+                    local_file_path,
+                    bucket_obj_name,
+                    remove_local_files,
+                    max_concurrency,
+                )
+                for local_file_path, bucket_obj_name in files
+            ]
+            # Re-raise the first upload error, if any
+            for future in futures:
+                future.result()
+
+    @staticmethod
+    def download_object_from_bucket(
+        bucket_name, bucket_obj_name, local_file_path, use_cache=False
+    ):
         """
         Given the identification of an object inside an AWS S3 bucket,
         downloads its contents to a local file.
-        """
 
-        bucket = boto3.resource("s3").Bucket(bucket_name)
-        bucket.download_file(bucket_obj_name, local_file_path)
+        With ``use_cache=True``, the object contents are also kept in memory, so
+        that later downloads of the same object within the same container are
+        served without calling S3. Use ``invalidate_cached_object()`` when the
+        object is known to have changed.
+        """
+        cache_key = (bucket_name, bucket_obj_name)
+        cached_contents = _object_cache.get(cache_key) if use_cache else None
+        if cached_contents is not None:
+            with open(local_file_path, "wb") as local_file:
+                local_file.write(cached_contents)
+            return
+
+        s3_client = BaseLambdaHandler._get_s3_client()
+        s3_client.download_file(
+            bucket_name,
+            bucket_obj_name,
+            local_file_path,
+            Config=BaseLambdaHandler._get_s3_transfer_config(
+                _S3_TRANSFER_MAX_CONCURRENCY
+            ),
+        )
+
+        if use_cache:
+            _cache_object(cache_key, local_file_path)
+
+    @staticmethod
+    def invalidate_cached_object(bucket_name, bucket_obj_name):
+        """
+        Removes an object from the cache used by ``download_object_from_bucket()``.
+        """
+        _object_cache.invalidate((bucket_name, bucket_obj_name))
 
     @staticmethod
     def send_message_to_sqs(
-        queue_url, message_body, message_group_id="same", verbose=True
+        queue_url, message_body, message_group_id="same", verbose=True, compress=False
     ) -> dict:
         """
         Send a message to an SQS queue.
@@ -462,6 +729,10 @@ class BaseLambdaHandler(ABC):
         - message_body (str): The message body you want to send.
         - message_group_id (str, optional): The message group ID to use for
             FIFO queues. Default is "same".
+        - compress (bool, optional): Whether to gzip message bodies larger than
+            64 KB. Compressed messages are flagged with a message attribute, and
+            are transparently decompressed by ``_load_body_from_event()``.
+            Default is False.
 
         Returns:
         - dict: Response from the `send_message` SQS API call.
@@ -478,14 +749,25 @@ class BaseLambdaHandler(ABC):
                 f"message_group_id {message_group_id}"
             )
 
-        # Initialize the SQS client
-        sqs_client = boto3.client("sqs")
+        # Retrieve the SQS client
+        sqs_client = BaseLambdaHandler._get_sqs_client()
+
+        extra_args = {}
+        if compress and len(message_body) > _COMPRESSION_MIN_SIZE:
+            message_body = _compress_message_body(message_body)
+            extra_args["MessageAttributes"] = {
+                _CONTENT_ENCODING_ATTRIBUTE: {
+                    "DataType": "String",
+                    "StringValue": "gzip",
+                },
+            }
 
         # Send the message
         response = sqs_client.send_message(
             QueueUrl=queue_url,
             MessageBody=message_body,
             MessageGroupId=message_group_id,  # required for FIFO queues
+            **extra_args,
         )
 
         if verbose:
@@ -493,6 +775,88 @@ class BaseLambdaHandler(ABC):
 
         return response
 
+    @staticmethod
+    def send_messages_to_sqs(
+        queue_url, message_bodies: list, message_group_id="same", verbose=True
+    ) -> list:
+        """
+        Send several messages to an SQS queue, in batches of up to 10 messages
+        and 256KB (the maximum accepted by the `send_message_batch` SQS API call).
+
+        Parameters:
+        - queue_url (str): The URL of the SQS queue.
+        - message_bodies (list): The message bodies you want to send. Non-string
+            bodies are serialized to JSON, and `None` bodies are skipped.
+        - message_group_id (str, optional): The message group ID to use for
+            FIFO queues. Default is "same".
+
+        Returns:
+        - list: Responses from the `send_message_batch` SQS API calls.
+
+        Raises:
+            SQSBatchSendError: If any message fails to be sent. The remaining
+                batches are still sent, and the error tells which messages
+                failed, so that only those need to be retried.
+        """
+        # Keep the position of each message, used as its entry Id
+        indexed_bodies = [
+            (
+                index,
+                (
+                    body
+                    if isinstance(body, str)
+                    else BaseLambdaHandler.json_dumps(body, indent=None)
+                ),
+            )
+            for index, body in enumerate(message_bodies)
+            if body is not None
+        ]
+
+        # Retrieve the SQS client
+        sqs_client = BaseLambdaHandler._get_sqs_client()
+
+        # Group the messages in batches within both limits of send_message_batch
+        batches = []
+        entries, entries_size = [], 0
+        for index, body in indexed_bodies:
+            body_size = len(body.encode("utf-8"))
+            if entries and (
+                len(entries) == _SQS_BATCH_MAX_MESSAGES
+                or entries_size + body_size > _SQS_BATCH_MAX_BYTES
+            ):
+                batches.append(entries)
+                entries, entries_size = [], 0
+            entries.append(
+                {
+                    "Id": str(index),
+                    "MessageBody": body,
+                    "MessageGroupId": message_group_id,  # required for FIFO queues
+                }
+            )
+            entries_size += body_size
+        if entries:
+            batches.append(entries)
+
+        responses, failed = [], []
+        for entries in batches:
+            response = sqs_client.send_message_batch(
+                QueueUrl=queue_url, Entries=entries
+            )
+            failed.extend(response.get("Failed") or [])
+            responses.append(response)
+
+        if verbose:
+            BaseLambdaHandler.do_log(
+                f"** send_messages_to_sqs: queue_url {queue_url}\n"
+                f"{len(indexed_bodies) - len(failed)} messages sent "
+                f"in {len(responses)} batches, {len(failed)} failed"
+            )
+
+        if failed:
+            raise SQSBatchSendError(failed, responses)
+
+        return responses
+
     @staticmethod
     def publish_to_sns(topic_arn: str, message, subject=None, verbose=True):
         """
@@ -503,7 +867,7 @@ class BaseLambdaHandler(ABC):
         - message (str): The message body you want to send.
         - subject (str, optional): The subject of the message. Default is None.
         """
-        sns_client = boto3.client("sns")
+        sns_client = BaseLambdaHandler._get_sns_client()
         _return = None
         if not isinstance(message, str):
             # If the message is not a string, convert it to JSON
@@ -524,12 +888,22 @@ class BaseLambdaHandler(ABC):
         return _return
 
     @staticmethod
-    def do_log(obj, title=None, line_len_limit: int = 100, deep_limit: int = 3):
+    def do_log(
+        obj,
+        title=None,
+        line_len_limit: int = 100,
+        deep_limit: int = 3,
+        level: str = "INFO",
+    ):
         """
         Wrapper function to call the do_log() function from the app_utils module.
         """
         app_utils._do_log(
-            obj, title=title, line_len_limit=line_len_limit, deep_limit=deep_limit
+            obj,
+            title=title,
+            line_len_limit=line_len_limit,
+            deep_limit=deep_limit,
+            level=level,
         )
 
     @staticmethod
@@ -551,8 +925,8 @@ class BaseLambdaHandler(ABC):
         if not function_name:
             return None
 
-        # Initialize the Lambda client
-        lambda_client = boto3.client("lambda")
+        # Retrieve the Lambda client
+        lambda_client = BaseLambdaHandler._get_lambda_client()
 
         # Ensure payload is a JSON string
         if isinstance(payload, dict) or (
@@ -579,10 +953,49 @@ class BaseLambdaHandler(ABC):
         # If synchronous invocation, read and return the Lambda function
         # response payload
         if not async_invoke:
-            return json.loads(response["Payload"].read())
+            return app_utils.json_loads(response["Payload"].read())
         else:
             return response
 
+    @staticmethod
+    def invoke_lambdas(invocations: list, async_invoke=False, max_workers: int = 8):
+        """
+        Invokes several AWS Lambda functions concurrently, overlapping the round
+        trips that ``invoke_lambda()`` would otherwise make one after the other.
+
+        Parameters:
+        - invocations (list): Pairs of (function_name, payload), as accepted by
+          ``invoke_lambda()``.
+        - async_invoke (bool, optional): If True, invoke the Lambda functions
+          asynchronously. Default is False (synchronous).
+        - max_workers (int, optional): Maximum number of concurrent invocations.
+            Default is 8.
+
+        Returns:
+        - list: The result of ``invoke_lambda()`` for each invocation, in the
+          same order.
+        """
+        if not invocations:
+            return []
+
+        # Create the shared client up front, so that threads don't race to do it
+        BaseLambdaHandler._get_lambda_client()
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(invocations))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    BaseLambdaHandler.invoke_lambda,
+                    function_name,
+                    payload,
+                    async_invoke,
+                )
+                for function_name, payload in invocations
+            ]
+            # Re-raises the first invocation error, if any
+            return [future.result() for future in futures]
+
     @staticmethod
     def response(
         status_code=200,
@@ -599,7 +1012,7 @@ class BaseLambdaHandler(ABC):
         dict_response = {
             "statusCode": status_code,
             "headers": headers,
-            "body": json.dumps(body, cls=app_utils.DecimalEncoder) if body else None,
+            "body": app_utils.json_dumps(body, indent=None) if body else None,
         }
 
         # Add a message to the response if provided and body is empty
@@ -614,9 +1027,7 @@ class BaseLambdaHandler(ABC):
         """
         Returns the body of the event or None if it is not present.
         """
-        if event and "body" in event:
-            return event["body"]
-        return None
+        return event.get("body") if event else None
 
     @staticmethod
     def get_env_var(name: str, default_value: str = None):
@@ -658,7 +1069,7 @@ class BaseLambdaHandler(ABC):
         Retrieves the SES client.
         Uses lru_cache to cache the client instance, avoiding multiple connections.
         """
-        return boto3.client("ses")
+        return _create_client("ses")
 
     def send_email_notification(
         self, from_email: str, to_email: str, subject: str, body: str
@@ -693,7 +1104,71 @@ class BaseLambdaHandler(ABC):
         Retrieves the SSM client.
         Uses lru_cache to cache the client instance, avoiding multiple connections.
         """
-        return boto3.client("ssm")
+        return _create_client("ssm")
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_s3_client():
+        """
+        Retrieves the S3 client.
+        Uses lru_cache to cache the client instance, avoiding multiple connections.
+        """
+        return _create_client("s3")
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _get_s3_transfer_config(max_concurrency: int):
+        """
+        Retrieves the transfer settings shared by S3 uploads and downloads.
+        Files above 16MB are split into 16MB parts, sent over up to
+        ``max_concurrency`` threads.
+        Uses lru_cache to build the settings only once per concurrency.
+        """
+        _import_boto3()
+        # pylint: disable=import-outside-toplevel
+        from boto3.s3.transfer import TransferConfig
+
+        return TransferConfig(
+            multipart_threshold=16 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=max_concurrency,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_sqs_client():
+        """
+        Retrieves the SQS client.
+        Uses lru_cache to cache the client instance, avoiding multiple connections.
+        """
+        return _create_client("sqs")
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_sns_client():
+        """
+        Retrieves the SNS client.
+        Uses lru_cache to cache the client instance, avoiding multiple connections.
+        """
+        return _create_client("sns")
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_lambda_client():
+        """
+        Retrieves the Lambda client.
+        Uses lru_cache to cache the client instance, avoiding multiple connections.
+        """
+        return _create_client("lambda")
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_events_client():
+        """
+        Retrieves the EventBridge client.
+        Uses lru_cache to cache the client instance, avoiding multiple connections.
+        """
+        return _create_client("events")
 
     @staticmethod
     def json_dumps(data, indent=4, cls=app_utils.DecimalEncoder) -> str:
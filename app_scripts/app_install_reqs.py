@@ -99,6 +99,29 @@ def _install_from_aws_common(do_log_func, run_cmd_func, target=None):
     do_log_func("*** Installation/upgrade completed successfully.")
 
 
+def _precompile_packages(do_log_func, run_cmd_func, packages_dir):
+    """
+    Precompile the packages installed in the given directory to bytecode.
+    Lambda can't write bytecode caches at runtime, so shipping them saves
+    compiling the packages on every cold start. Unchecked hash-based .pyc
+    files are used, as file timestamps may change when assets are bundled;
+    ``-f`` rewrites the timestamp-based ones pip already wrote on install.
+    """
+    run_cmd_func(
+        [
+            "python3.11",
+            "-m",
+            "compileall",
+            "-q",
+            "-f",
+            "--invalidation-mode",
+            "unchecked-hash",
+            packages_dir,
+        ]
+    )
+    do_log_func(f"*** Precompiled {packages_dir}.")
+
+
 def _install_requirements_recursively(do_log_func, run_cmd_func):
     """
     Recursively traverse the project directory and install all requirements.txt files.
@@ -169,8 +192,11 @@ def _install_requirements_recursively(do_log_func, run_cmd_func):
                         ]
                     )
 
+            _precompile_packages(do_log_func, run_cmd_func, packages_dir)
+
         # Special handling for AWS Lambda Layers
         if root.startswith(("layers", "./layers")):
+            site_packages_dir = os.path.join(root, "lib/python3.11/site-packages")
             run_cmd_func(
                 [
                     "pip",
@@ -178,11 +204,12 @@ def _install_requirements_recursively(do_log_func, run_cmd_func):
                     "-r",
                     pip_requirements_path,
                     "--target",
-                    os.path.join(root, "lib/python3.11/site-packages"),
+                    site_packages_dir,
                     "--upgrade",
                     "--quiet",
                 ]
             )
+            _precompile_packages(do_log_func, run_cmd_func, site_packages_dir)
 
 
 def _install_other_packages(do_log_func, run_cmd_func):
@@ -0,0 +1,145 @@
+import pytest
+
+# aws-cdk-lib is provided by the CDK projects using this package
+pytest.importorskip("aws_cdk")
+
+from aws_cdk import App  # noqa: E402
+from aws_cdk import aws_iam as iam  # noqa: E402
+from aws_cdk import aws_lambda as _lambda  # noqa: E402
+from aws_cdk.assertions import Template  # noqa: E402
+
+from app_common.app_common_stack import AppCommonStack  # noqa: E402
+
+
+class StackWithLambdas(AppCommonStack):
+    def __init__(
+        self, scope, construct_id, lambda_count, role_factories=None, **kwargs
+    ):
+        super().__init__(scope, construct_id, **kwargs)
+
+        role_factories = role_factories or {}
+        for index in range(lambda_count):
+            role_factory = role_factories.get(index)
+            _lambda.Function(
+                self,
+                f"Lambda{index}",
+                runtime=_lambda.Runtime.PYTHON_3_11,
+                handler="index.handler",
+                code=_lambda.Code.from_inline("def handler(event, context): pass"),
+                role=role_factory(self) if role_factory else None,
+            )
+
+
+def _imported_role(mutable):
+    """
+    Returns a factory of a role imported into the stack by ARN.
+    """
+    return lambda stack: iam.Role.from_role_arn(
+        stack, "ImportedRole", "arn:aws:iam::123456789012:role/ext", mutable=mutable
+    )
+
+
+def _shared_role(stack):
+    """
+    Returns a role created once in the stack, to be shared by several Lambdas.
+    """
+    return stack.node.try_find_child("SharedRole") or iam.Role(
+        stack, "SharedRole", assumed_by=iam.ServicePrincipal("lambda.amazonaws.com")
+    )
+
+
+def _publish_statements(template, resource_type):
+    """
+    Returns the events:PutEvents statements of the given type of IAM policies.
+    """
+    return [
+        statement
+        for policy in template.find_resources(resource_type).values()
+        for statement in policy["Properties"]["PolicyDocument"]["Statement"]
+        if statement["Action"] == "events:PutEvents"
+    ]
+
+
+class TestGrantPublishToCustomEventBusAspect:
+    def setup_method(self):
+        """
+        Synthesize a stack with several Lambda functions, each with its own role.
+        """
+        self.lambda_count = 3
+        stack = StackWithLambdas(App(), "TestStack", lambda_count=self.lambda_count)
+        self.template = Template.from_stack(stack)
+
+    def test_single_publish_policy_shared_by_all_lambdas(self):
+        """
+        Test that a single managed policy holds the events:PutEvents statement,
+        attached to the role of every Lambda function.
+        """
+        policies = self.template.find_resources("AWS::IAM::ManagedPolicy")
+        assert len(policies) == 1
+
+        ((policy_id, policy),) = policies.items()
+        statements = policy["Properties"]["PolicyDocument"]["Statement"]
+        assert len(statements) == 1
+        assert statements[0]["Action"] == "events:PutEvents"
+        assert len(policy["Properties"]["Roles"]) == self.lambda_count
+
+        # No inline policy grants the same permission again
+        assert _publish_statements(self.template, "AWS::IAM::Policy") == []
+
+    def test_lambdas_depend_on_publish_policy(self):
+        """
+        Test that every Lambda function is deployed only after the policy exists.
+        """
+        (policy_id,) = self.template.find_resources("AWS::IAM::ManagedPolicy")
+        functions = self.template.find_resources("AWS::Lambda::Function")
+        assert len(functions) == self.lambda_count
+
+        for function in functions.values():
+            assert policy_id in function["DependsOn"]
+
+    def test_immutable_imported_role_is_left_alone(self):
+        """
+        Test that the managed policy is not attached to an imported role marked
+        as immutable.
+        """
+        stack = StackWithLambdas(
+            App(),
+            "TestStack",
+            lambda_count=2,
+            role_factories={1: _imported_role(False)},
+        )
+        template = Template.from_stack(stack)
+
+        (policy,) = template.find_resources("AWS::IAM::ManagedPolicy").values()
+        roles = policy["Properties"]["Roles"]
+        assert len(roles) == 1
+        assert "ext" not in roles
+        assert _publish_statements(template, "AWS::IAM::Policy") == []
+
+    def test_mutable_imported_role_gets_inline_statement(self):
+        """
+        Test that a mutable imported role is granted through an inline policy
+        instead of the shared managed policy.
+        """
+        stack = StackWithLambdas(
+            App(), "TestStack", lambda_count=1, role_factories={0: _imported_role(True)}
+        )
+        template = Template.from_stack(stack)
+
+        assert template.find_resources("AWS::IAM::ManagedPolicy") == {}
+        assert len(_publish_statements(template, "AWS::IAM::Policy")) == 1
+
+    def test_shared_role_is_attached_once(self):
+        """
+        Test that a role shared by several Lambdas is attached to the policy once.
+        """
+        stack = StackWithLambdas(
+            App(),
+            "TestStack",
+            lambda_count=2,
+            role_factories={0: _shared_role, 1: _shared_role},
+        )
+        template = Template.from_stack(stack)
+
+        (policy,) = template.find_resources("AWS::IAM::ManagedPolicy").values()
+        assert len(policy["Properties"]["Roles"]) == 1
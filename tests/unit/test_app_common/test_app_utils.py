@@ -1,5 +1,6 @@
 import decimal
 import json
+import os
 import sys
 from unittest.mock import MagicMock, patch
 
@@ -9,10 +10,15 @@ import urllib3
 from app_common.app_utils import (
     DecimalEncoder,
     _do_log,
+    _get_pool_manager,
+    _str_is_numeric,
     get_first_element,
     get_first_non_none,
     http_request,
+    is_logging_enabled,
     is_numeric,
+    json_dumps,
+    json_loads,
     run_command,
     str_is_none_or_empty,
 )
@@ -72,6 +78,69 @@ class TestDecimalEncoder:
             json.dumps({"obj": CustomObject()}, cls=DecimalEncoder)
 
 
+class TestJsonDumps:
+    def test_json_dumps_matches_json_module(self):
+        # Test that the shared encoder produces the same output as json.dumps
+        data = {"decimal": decimal.Decimal("1.5"), "list": [1, "a"], "none": None}
+        assert json_dumps(data) == json.dumps(data, indent=4, cls=DecimalEncoder)
+        assert json_dumps(data, indent=None) == json.dumps(data, cls=DecimalEncoder)
+
+    def test_json_dumps_repeated_calls(self):
+        # Test that reusing the encoder does not carry state between calls
+        assert json_dumps({"a": 1}, indent=None) == '{"a": 1}'
+        assert json_dumps([decimal.Decimal("2")], indent=None) == '["2"]'
+
+
+class TestJsonLoads:
+    def test_json_loads_str_and_bytes(self):
+        # Test that both strings and bytes are parsed
+        assert json_loads('{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+        assert json_loads(b'{"a": "b"}') == {"a": "b"}
+
+    @patch("app_common.app_utils.orjson", None)
+    def test_json_loads_without_orjson(self):
+        # Test the fallback to the json module
+        assert json_loads(b'{"a": true}') == {"a": True}
+
+    def test_json_loads_invalid(self):
+        # Test that invalid JSON raises the standard decoding error
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("{invalid")
+
+    def test_json_loads_uses_orjson(self):
+        # Test that orjson, when installed, parses the common input
+        orjson_mock = MagicMock(JSONDecodeError=json.JSONDecodeError)
+        orjson_mock.loads.return_value = {"a": 1}
+        with patch("app_common.app_utils.orjson", orjson_mock):
+            assert json_loads(b'{"a": 1}') == {"a": 1}
+        orjson_mock.loads.assert_called_once_with(b'{"a": 1}')
+
+    def test_json_loads_orjson_fallbacks(self):
+        # Test that the input orjson parses differently is left to json.loads()
+        orjson_mock = MagicMock(JSONDecodeError=json.JSONDecodeError)
+        orjson_mock.loads.side_effect = json.JSONDecodeError("NaN", "", 0)
+        with patch("app_common.app_utils.orjson", orjson_mock):
+            big_int = 123456789012345678901234567890
+            assert json_loads(f'{{"id": {big_int}}}') == {"id": big_int}
+            assert json_loads(b"[1e2, 12345678901234567890]")[1] > 2**63
+            assert orjson_mock.loads.call_count == 0
+
+            assert json_loads('{"x": NaN}')["x"] != json_loads('{"x": NaN}')["x"]
+            assert orjson_mock.loads.call_count == 2
+            with pytest.raises(json.JSONDecodeError):
+                json_loads("{invalid")
+
+    def test_json_loads_same_as_json_module(self):
+        # Test that the result matches json.loads() with the installed parser
+        for data in [
+            '{"id": 123456789012345678901234567890}',
+            b"[-9223372036854775809, 18446744073709551616, 1.5]",
+            '{"x": Infinity, "y": -Infinity}',
+            '{"text": "\\u00e9", "n": null}',
+        ]:
+            assert json_loads(data) == json.loads(data)
+
+
 class TestGetFirstNonNone:
     def test_get_first_non_none_with_all_none_args(self):
         """
@@ -308,8 +377,90 @@ class TestIsNumeric:
         result = is_numeric("   ")
         assert result is False
 
+    def test_is_numeric_with_bool_and_decimal(self):
+        """
+        Test that types outside the fast path are still checked via float().
+        """
+        assert is_numeric(True) is True
+        assert is_numeric(decimal.Decimal("1.5")) is True
+
+    def test_is_numeric_repeated_string(self):
+        """
+        Test that repeated (cached) strings give consistent results.
+        """
+        assert is_numeric("12.5") is True
+        assert is_numeric("12.5") is True
+        assert is_numeric("x12") is False
+        assert is_numeric("x12") is False
+
+    def test_is_numeric_long_strings_not_cached(self):
+        """
+        Test that long strings are checked without being kept in the cache.
+        """
+        _str_is_numeric.cache_clear()
+        assert is_numeric("1" * 65) is True
+        assert is_numeric("x" * 1000) is False
+        assert _str_is_numeric.cache_info().currsize == 0
+
 
 class TestDoLog:
+    @patch.dict(os.environ, {"LOG_LEVEL": "WARNING"})
+    @patch("builtins.print")
+    def test_do_log_below_log_level(self, mock_print):
+        """
+        Test that messages below LOG_LEVEL are neither built nor printed.
+        """
+        built = []
+        _do_log(msg_factory=lambda: built.append("message") or "Not logged")
+        _do_log("Not logged either", level="INFO")
+        assert built == []
+        mock_print.assert_not_called()
+
+        _do_log("Logged", level="ERROR")
+        mock_print.assert_called_once_with("Logged")
+
+    @patch.dict(os.environ, {"LOG_LEVEL": "debug"})
+    def test_is_logging_enabled_levels(self):
+        """
+        Test the level comparison, which is case-insensitive.
+        """
+        assert is_logging_enabled("DEBUG") is True
+        assert is_logging_enabled("INFO") is True
+        assert is_logging_enabled("ERROR") is True
+
+    @patch.dict(os.environ, {"LOG_LEVEL": "WARN"})
+    def test_is_logging_enabled_aliases(self):
+        """
+        Test that the WARN and FATAL aliases are accepted.
+        """
+        assert is_logging_enabled("INFO") is False
+        assert is_logging_enabled("WARNING") is True
+        with patch.dict(os.environ, {"LOG_LEVEL": "fatal"}):
+            assert is_logging_enabled("ERROR") is False
+            assert is_logging_enabled("CRITICAL") is True
+
+    @patch.dict(os.environ, {"LOG_LEVEL": "VERBOSE"})
+    @patch("app_common.app_utils._unknown_log_levels", set())
+    @patch("builtins.print")
+    def test_is_logging_enabled_unknown_level(self, mock_print):
+        """
+        Test that an unknown LOG_LEVEL logs everything and is reported once.
+        """
+        assert is_logging_enabled("DEBUG") is True
+        assert is_logging_enabled("INFO") is True
+        mock_print.assert_called_once_with(
+            "Unknown LOG_LEVEL 'VERBOSE', logging everything"
+        )
+
+    def test_is_logging_enabled_follows_environment(self):
+        """
+        Test that changes to LOG_LEVEL take effect immediately.
+        """
+        with patch.dict(os.environ, {"LOG_LEVEL": "INFO"}):
+            assert is_logging_enabled("DEBUG") is False
+        with patch.dict(os.environ, {"LOG_LEVEL": "DEBUG"}):
+            assert is_logging_enabled("DEBUG") is True
+
     @patch("builtins.print")
     def test_do_log_string(self, mock_print):
         """
@@ -329,6 +480,27 @@ class TestDoLog:
         _do_log(test_str, line_len_limit=line_len_limit)
         mock_print.assert_called_once_with(("a" * line_len_limit) + "...")
 
+    @patch("builtins.print")
+    def test_do_log_message_factory(self, mock_print):
+        """
+        Test logging a message built lazily by a zero-argument function.
+        """
+        _do_log(msg_factory=lambda: "Built " + "lazily")
+        mock_print.assert_called_once_with("Built lazily")
+
+    @patch("builtins.print")
+    def test_do_log_function_object(self, mock_print):
+        """
+        Test that a function given as the object is logged, not called.
+        """
+
+        def not_a_factory():
+            raise AssertionError("should not be called")
+
+        _do_log(not_a_factory)
+        mock_print.assert_called_once()
+        assert mock_print.call_args.args[0].startswith("<function ")
+
     @patch("builtins.print")
     def test_do_log_with_title(self, mock_print):
         """
@@ -612,6 +784,30 @@ class TestDoLog:
 
 
 class TestHttpRequest:
+    def setup_method(self):
+        # The pool manager is cached, so each test must see its own mock
+        _get_pool_manager.cache_clear()
+
+    def teardown_method(self):
+        _get_pool_manager.cache_clear()
+
+    @patch("urllib3.PoolManager")
+    def test_http_request_reuses_pool_manager(self, mock_pool_manager):
+        """
+        Test that consecutive requests share the same pool manager.
+        """
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {"Content-Type": "text/plain"}
+        mock_response.data = b"ok"
+        mock_pool_manager.return_value.request.return_value = mock_response
+
+        http_request("GET", "http://example.com")
+        http_request("GET", "http://example.com")
+
+        mock_pool_manager.assert_called_once_with()
+        assert mock_pool_manager.return_value.request.call_count == 2
+
     @patch("urllib3.PoolManager")
     def test_http_request_get_success(self, mock_pool_manager):
         """
@@ -1,12 +1,18 @@
 import base64
 import json
 import os
+import sys
+import tempfile
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from app_common.app_utils import DecimalEncoder
-from app_common.base_lambda_handler import BaseLambdaHandler
+from app_common.base_lambda_handler import (
+    BaseLambdaHandler,
+    SQSBatchSendError,
+    _get_object_cache_max_bytes,
+)
 
 
 # Create a concrete subclasses for testing purposes
@@ -48,12 +54,36 @@ class SecurityFailingTestLambdaHandler(TestLambdaHandler):
         return False
 
 
+def clear_boto3_client_caches():
+    """
+    Clears the cached boto3 clients, so that each test sees its own mocks.
+    """
+    for get_client in (
+        BaseLambdaHandler._get_s3_client,
+        BaseLambdaHandler._get_s3_transfer_config,
+        BaseLambdaHandler._get_sqs_client,
+        BaseLambdaHandler._get_sns_client,
+        BaseLambdaHandler._get_lambda_client,
+        BaseLambdaHandler._get_events_client,
+        BaseLambdaHandler._get_ses_client,
+        BaseLambdaHandler._get_ssm_client,
+    ):
+        get_client.cache_clear()
+
+
 class TestBaseLambdaHandler:
     def setup_method(self):
         """
         Set up a new instance of TestLambdaHandler before each test.
         """
         self.handler = TestLambdaHandler()
+        clear_boto3_client_caches()
+
+    def teardown_method(self):
+        """
+        Do not leak mocked clients into other tests.
+        """
+        clear_boto3_client_caches()
 
     def test_initialization(self):
         """
@@ -97,6 +127,7 @@ class TestBaseLambdaHandler:
         # Check that the default message is printed
         mock_do_log.assert_any_call(
             "Running before_handle()...",
+            level="DEBUG",
         )
 
     @patch("app_common.base_lambda_handler.BaseLambdaHandler.do_log")
@@ -123,6 +154,7 @@ class TestBaseLambdaHandler:
         # Check that the default message is printed
         mock_do_log.assert_any_call(
             "Running after_handle()...",
+            level="DEBUG",
         )
 
     @patch("app_common.base_lambda_handler.BaseLambdaHandler.do_log")
@@ -188,6 +220,17 @@ class TestBaseLambdaHandler:
         result = self.handler._load_body_from_event()
         assert result == b"test body"
 
+    def test_load_body_from_event_json_parsed_like_json_module(self):
+        """
+        Test that bodies are parsed exactly as json.loads() would, whatever JSON
+        parser is installed.
+        """
+        raw_body = '{"id": 123456789012345678901234567890, "ratio": NaN}'
+        self.handler.event = {"body": raw_body}
+        result = self.handler._load_body_from_event()
+        assert result["id"] == 123456789012345678901234567890
+        assert result["ratio"] != result["ratio"]  # NaN
+
     def test_load_body_from_event_sqs_record(self):
         """
         Test that _load_body_from_event extracts body from SQS record.
@@ -204,6 +247,17 @@ class TestBaseLambdaHandler:
         result = self.handler._load_body_from_event()
         assert result == "sns message body"
 
+    def test_load_body_from_event_unknown_record(self):
+        """
+        Test that _load_body_from_event falls back to the whole event when the
+        records carry neither an SQS body nor an SNS message.
+        """
+        for event in ({"Records": []}, {"Records": [{"Sns": {}}]}):
+            self.handler.body = None
+            self.handler.event = event
+            result = self.handler._load_body_from_event()
+            assert result == event
+
     @patch("app_common.base_lambda_handler.BaseLambdaHandler.do_log")
     def test_load_body_from_event_invalid_json(self, mock_do_log):
         """
@@ -314,6 +368,17 @@ class TestBaseLambdaHandler:
         )
         mock_do_log.assert_any_call(self.handler.body, title="*** Body", deep_limit=5)
 
+    @patch.dict(os.environ, {"LOG_LEVEL": "ERROR"})
+    @patch("app_common.base_lambda_handler.BaseLambdaHandler.do_log")
+    def test_log_basic_info_disabled(self, mock_do_log):
+        """
+        Test that _log_basic_info logs nothing when LOG_LEVEL is above INFO.
+        """
+        self.handler.event = {"key": "event_value"}
+        self.handler._log_basic_info()
+
+        mock_do_log.assert_not_called()
+
     @patch("app_common.base_lambda_handler.BaseLambdaHandler.do_log")
     def test_call_method(self, mock_do_log):
         """
@@ -346,6 +411,7 @@ class TestBaseLambdaHandler:
         # Verify that the finishing print statement is called
         mock_do_log.assert_any_call(
             "** Finishing the lambda execution",
+            level="DEBUG",
         )
 
     @patch("app_common.base_lambda_handler.BaseLambdaHandler.do_log")
@@ -372,6 +438,7 @@ class TestBaseLambdaHandler:
         # Verify that the finishing print statement is called
         mock_do_log.assert_any_call(
             "** Finishing the lambda execution",
+            level="DEBUG",
         )
 
     def test_do_the_job_success_flow(self):
@@ -411,15 +478,15 @@ class TestBaseLambdaHandler:
         """
         assert self.handler._get_temp_dir_path() == "/tmp/"
 
-    @patch("boto3.resource")
+    @patch("boto3.client")
     @patch("os.remove")
-    def test_upload_to_bucket(self, mock_os_remove, mock_boto3_resource):
+    def test_upload_to_bucket(self, mock_os_remove, mock_boto3_client):
         """
         Test that upload_to_bucket uploads the file and optionally removes
         the local file.
         """
-        bucket_mock = MagicMock()
-        mock_boto3_resource.return_value.Bucket.return_value = bucket_mock
+        s3_client_mock = MagicMock()
+        mock_boto3_client.return_value = s3_client_mock
 
         bucket_name = "test-bucket"
         local_file_path = "test.txt"
@@ -429,8 +496,11 @@ class TestBaseLambdaHandler:
         self.handler.upload_to_bucket(
             bucket_name, local_file_path, bucket_obj_name, remove_local_file=True
         )
-        bucket_mock.upload_file.assert_called_once_with(
-            local_file_path, bucket_obj_name
+        s3_client_mock.upload_file.assert_called_once_with(
+            local_file_path,
+            bucket_name,
+            bucket_obj_name,
+            Config=self.handler._get_s3_transfer_config(16),
         )
         mock_os_remove.assert_called_once_with(local_file_path)
 
@@ -441,14 +511,65 @@ class TestBaseLambdaHandler:
         )
         mock_os_remove.assert_not_called()
 
-    @patch("boto3.resource")
-    def test_download_object_from_bucket(self, mock_boto3_resource):
+    @patch("boto3.client")
+    @patch("os.remove")
+    def test_upload_files_to_bucket(self, mock_os_remove, mock_boto3_client):
+        """
+        Test that upload_files_to_bucket uploads every file with a single client
+        and removes the local files.
+        """
+        s3_client_mock = MagicMock()
+        mock_boto3_client.return_value = s3_client_mock
+
+        files = [("a.txt", "dir/a.txt"), ("b.txt", "dir/b.txt"), ("c.txt", "c.txt")]
+        self.handler.upload_files_to_bucket("test-bucket", files)
+
+        mock_boto3_client.assert_called_once()
+        uploads = s3_client_mock.upload_file.call_args_list
+        assert sorted(call.args for call in uploads) == [
+            (local, "test-bucket", key) for local, key in files
+        ]
+        removals = mock_os_remove.call_args_list
+        assert sorted(call.args[0] for call in removals) == ["a.txt", "b.txt", "c.txt"]
+
+    @patch("boto3.client")
+    @patch("os.remove")
+    def test_upload_files_to_bucket_fits_connection_pool(
+        self, mock_os_remove, mock_boto3_client
+    ):
+        """
+        Test that concurrent uploads, and the parts of each, do not open more
+        connections than the client's pool keeps alive.
+        """
+        s3_client_mock = mock_boto3_client.return_value
+        files = [(f"{i}.txt", f"{i}.txt") for i in range(20)]
+
+        self.handler.upload_files_to_bucket("test-bucket", files, max_workers=8)
+
+        pool_size = mock_boto3_client.call_args.kwargs["config"].max_pool_connections
+        for call in s3_client_mock.upload_file.call_args_list:
+            assert 8 * call.kwargs["Config"].max_concurrency <= pool_size
+
+    @patch("boto3.client")
+    def test_upload_files_to_bucket_error(self, mock_boto3_client):
+        """
+        Test that upload errors are propagated to the caller.
+        """
+        mock_boto3_client.return_value.upload_file.side_effect = OSError("failed")
+
+        with pytest.raises(OSError):
+            self.handler.upload_files_to_bucket(
+                "test-bucket", [("a.txt", "a.txt")], remove_local_files=False
+            )
+
+    @patch("boto3.client")
+    def test_download_object_from_bucket(self, mock_boto3_client):
         """
         Test that download_object_from_bucket downloads the file from S3 to the
         specified local path.
         """
-        bucket_mock = MagicMock()
-        mock_boto3_resource.return_value.Bucket.return_value = bucket_mock
+        s3_client_mock = MagicMock()
+        mock_boto3_client.return_value = s3_client_mock
 
         bucket_name = "test-bucket"
         bucket_obj_name = "test/test.txt"
@@ -457,10 +578,121 @@ class TestBaseLambdaHandler:
         self.handler.download_object_from_bucket(
             bucket_name, bucket_obj_name, local_file_path
         )
-        bucket_mock.download_file.assert_called_once_with(
-            bucket_obj_name, local_file_path
+        s3_client_mock.download_file.assert_called_once_with(
+            bucket_name,
+            bucket_obj_name,
+            local_file_path,
+            Config=self.handler._get_s3_transfer_config(16),
         )
 
+    @patch("boto3.client")
+    def test_download_object_from_bucket_cache(self, mock_boto3_client):
+        """
+        Test that cached objects are downloaded from S3 only once, until they are
+        invalidated.
+        """
+
+        def download_file(bucket_name, bucket_obj_name, local_file_path, Config):
+            with open(local_file_path, "w") as local_file:
+                local_file.write("contents")
+
+        s3_client_mock = mock_boto3_client.return_value
+        s3_client_mock.download_file.side_effect = download_file
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first_path = os.path.join(temp_dir, "first.txt")
+            second_path = os.path.join(temp_dir, "second.txt")
+
+            self.handler.download_object_from_bucket(
+                "bucket", "obj.txt", first_path, use_cache=True
+            )
+            self.handler.download_object_from_bucket(
+                "bucket", "obj.txt", second_path, use_cache=True
+            )
+            assert s3_client_mock.download_file.call_count == 1
+            with open(second_path) as local_file:
+                assert local_file.read() == "contents"
+
+            self.handler.invalidate_cached_object("bucket", "obj.txt")
+            self.handler.download_object_from_bucket(
+                "bucket", "obj.txt", second_path, use_cache=True
+            )
+            assert s3_client_mock.download_file.call_count == 2
+
+        self.handler.invalidate_cached_object("bucket", "obj.txt")
+
+    @patch.dict(os.environ, {"S3_OBJECT_CACHE_MAX_BYTES": "10"})
+    @patch("boto3.client")
+    def test_download_object_from_bucket_cache_eviction(self, mock_boto3_client):
+        """
+        Test that the least recently used objects are evicted to keep the cache
+        within S3_OBJECT_CACHE_MAX_BYTES.
+        """
+
+        def download_file(bucket_name, bucket_obj_name, local_file_path, Config):
+            with open(local_file_path, "w") as local_file:
+                local_file.write(bucket_obj_name * 4)
+
+        s3_client_mock = mock_boto3_client.return_value
+        s3_client_mock.download_file.side_effect = download_file
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local_file_path = os.path.join(temp_dir, "obj.txt")
+            for bucket_obj_name in ["a", "b", "a", "c", "a", "b"]:
+                self.handler.download_object_from_bucket(
+                    "bucket", bucket_obj_name, local_file_path, use_cache=True
+                )
+
+        # "b" was evicted by "c", as "a" had been used more recently
+        downloads = [call.args[1] for call in s3_client_mock.download_file.mock_calls]
+        assert downloads == ["a", "b", "c", "b"]
+
+        for bucket_obj_name in ["a", "b", "c"]:
+            self.handler.invalidate_cached_object("bucket", bucket_obj_name)
+
+    @patch.dict(os.environ, {"S3_OBJECT_CACHE_MAX_BYTES": "64MB"})
+    @patch("app_common.app_utils._do_log")
+    def test_object_cache_max_bytes_invalid(self, mock_do_log):
+        """
+        Test that an invalid S3_OBJECT_CACHE_MAX_BYTES falls back to the default.
+        """
+        assert _get_object_cache_max_bytes() == 64 * 1024 * 1024
+        mock_do_log.assert_called_once()
+
+    def test_missing_boto3_raises_runtime_error(self):
+        """
+        Test that a clear error is raised when boto3 is needed but missing.
+        """
+        with patch.dict(sys.modules, {"boto3": None}):
+            with pytest.raises(RuntimeError):
+                self.handler._get_s3_client()
+
+    @patch("boto3.client")
+    def test_clients_are_cached(self, mock_boto3_client):
+        """
+        Test that boto3 clients are created once and then reused.
+        """
+        self.handler.download_object_from_bucket("bucket", "a.txt", "a.txt")
+        self.handler.download_object_from_bucket("bucket", "b.txt", "b.txt")
+        self.handler.publish_to_sns("arn:topic", "message", verbose=False)
+        self.handler.publish_to_sns("arn:topic", "message", verbose=False)
+
+        assert mock_boto3_client.call_count == 2
+        service_names = [call.args[0] for call in mock_boto3_client.call_args_list]
+        assert service_names == ["s3", "sns"]
+
+    @patch("boto3.client")
+    def test_clients_use_keepalive_config(self, mock_boto3_client):
+        """
+        Test that clients are created with TCP keep-alive and pooled connections.
+        """
+        self.handler._get_sqs_client()
+
+        config = mock_boto3_client.call_args.kwargs["config"]
+        assert config.tcp_keepalive is True
+        assert config.max_pool_connections == 50
+        assert config.retries == {"mode": "standard", "max_attempts": 3}
+
     @patch("boto3.client")
     @patch("app_common.base_lambda_handler.BaseLambdaHandler.do_log")
     def test_send_message_to_sqs(self, mock_do_log, mock_boto3_client):
@@ -540,6 +772,147 @@ class TestBaseLambdaHandler:
         # Check the response
         assert response == {"MessageId": "12345"}
 
+    @patch("boto3.client")
+    def test_send_message_to_sqs_compressed(self, mock_boto3_client):
+        """
+        Test that large messages are compressed when asked to, and that the
+        receiving handler transparently decompresses them.
+        """
+        sqs_client_mock = MagicMock()
+        mock_boto3_client.return_value = sqs_client_mock
+
+        message_body = {"data": "x" * 100_000}
+        self.handler.send_message_to_sqs(
+            "test-queue", message_body, verbose=False, compress=True
+        )
+
+        call_kwargs = sqs_client_mock.send_message.call_args.kwargs
+        assert len(call_kwargs["MessageBody"]) < 10_000
+        assert call_kwargs["MessageAttributes"] == {
+            "ContentEncoding": {"DataType": "String", "StringValue": "gzip"}
+        }
+
+        # Simulate the SQS event received by the consumer Lambda
+        self.handler.event = {
+            "Records": [
+                {
+                    "body": call_kwargs["MessageBody"],
+                    "messageAttributes": {
+                        "ContentEncoding": {
+                            "stringValue": "gzip",
+                            "dataType": "String",
+                        }
+                    },
+                }
+            ]
+        }
+        assert self.handler._load_body_from_event() == message_body
+
+    @patch("boto3.client")
+    def test_send_message_to_sqs_small_message_not_compressed(self, mock_boto3_client):
+        """
+        Test that small messages are sent as is, even when compression is on.
+        """
+        sqs_client_mock = MagicMock()
+        mock_boto3_client.return_value = sqs_client_mock
+
+        self.handler.send_message_to_sqs(
+            "test-queue", "small", verbose=False, compress=True
+        )
+
+        sqs_client_mock.send_message.assert_called_once_with(
+            QueueUrl="test-queue", MessageBody="small", MessageGroupId="same"
+        )
+
+    @patch("boto3.client")
+    def test_send_messages_to_sqs_in_batches(self, mock_boto3_client):
+        """
+        Test that send_messages_to_sqs sends the messages in batches of 10,
+        serializing non-string bodies and skipping None bodies. Entry Ids are the
+        positions of the messages in the given list.
+        """
+        sqs_client_mock = MagicMock()
+        mock_boto3_client.return_value = sqs_client_mock
+        sqs_client_mock.send_message_batch.return_value = {"Successful": []}
+
+        queue_url = "https://sqs.us-east-1.amazonaws.com/123456789012/test-queue"
+        message_bodies = [f"message {i}" for i in range(11)] + [None, {"key": 1}]
+
+        responses = self.handler.send_messages_to_sqs(
+            queue_url, message_bodies, message_group_id="group", verbose=False
+        )
+
+        assert len(responses) == 2
+        first_call, second_call = sqs_client_mock.send_message_batch.call_args_list
+        assert first_call.kwargs["QueueUrl"] == queue_url
+        assert len(first_call.kwargs["Entries"]) == 10
+        assert first_call.kwargs["Entries"][0] == {
+            "Id": "0",
+            "MessageBody": "message 0",
+            "MessageGroupId": "group",
+        }
+        assert second_call.kwargs["Entries"] == [
+            {"Id": "10", "MessageBody": "message 10", "MessageGroupId": "group"},
+            {"Id": "12", "MessageBody": '{"key": 1}', "MessageGroupId": "group"},
+        ]
+
+    @patch("boto3.client")
+    def test_send_messages_to_sqs_batch_size_limit(self, mock_boto3_client):
+        """
+        Test that send_messages_to_sqs closes a batch before its bodies exceed
+        the total size accepted by SQS.
+        """
+        sqs_client_mock = mock_boto3_client.return_value
+        sqs_client_mock.send_message_batch.return_value = {"Successful": []}
+
+        message_bodies = ["a" * 100 * 1024, "b" * 100 * 1024, "c" * 100 * 1024, "d"]
+        self.handler.send_messages_to_sqs("test-queue", message_bodies, verbose=False)
+
+        batches = [
+            [entry["MessageBody"][0] for entry in call.kwargs["Entries"]]
+            for call in sqs_client_mock.send_message_batch.call_args_list
+        ]
+        assert batches == [["a", "b"], ["c", "d"]]
+
+    @patch("boto3.client")
+    def test_send_messages_to_sqs_failure(self, mock_boto3_client):
+        """
+        Test that send_messages_to_sqs raises an error when a message fails.
+        """
+        sqs_client_mock = MagicMock()
+        mock_boto3_client.return_value = sqs_client_mock
+        sqs_client_mock.send_message_batch.return_value = {
+            "Failed": [{"Id": "0", "Code": "InternalError"}]
+        }
+
+        with pytest.raises(RuntimeError):
+            self.handler.send_messages_to_sqs("test-queue", ["a"], verbose=False)
+
+    @patch("boto3.client")
+    def test_send_messages_to_sqs_partial_failure(self, mock_boto3_client):
+        """
+        Test that a failed batch does not stop the remaining ones, and that the
+        error tells which messages failed along with all the responses.
+        """
+        sqs_client_mock = mock_boto3_client.return_value
+        first_response = {"Failed": [{"Id": "3", "Code": "InternalError"}]}
+        second_response = {"Successful": [{"Id": "10"}]}
+        sqs_client_mock.send_message_batch.side_effect = [
+            first_response,
+            second_response,
+        ]
+
+        message_bodies = [f"message {i}" for i in range(11)]
+        with pytest.raises(SQSBatchSendError) as error_info:
+            self.handler.send_messages_to_sqs(
+                "test-queue", message_bodies, verbose=False
+            )
+
+        assert sqs_client_mock.send_message_batch.call_count == 2
+        assert error_info.value.failed == [{"Id": "3", "Code": "InternalError"}]
+        assert error_info.value.responses == [first_response, second_response]
+        assert isinstance(error_info.value, RuntimeError)
+
     @patch("boto3.client")
     @patch("app_common.base_lambda_handler.BaseLambdaHandler.do_log")
     def test_publish_to_sns(self, mock_do_log, mock_boto3_client):
@@ -666,6 +1039,43 @@ class TestBaseLambdaHandler:
         # Check the response
         assert response == {"ResponseMetadata": {"HTTPStatusCode": 202}}
 
+    @patch("boto3.client")
+    def test_invoke_lambdas(self, mock_boto3_client):
+        """
+        Test that invoke_lambdas invokes every function with a single client and
+        returns their payloads in order.
+        """
+        lambda_client_mock = mock_boto3_client.return_value
+
+        def invoke(FunctionName, InvocationType, Payload):
+            payload_mock = MagicMock()
+            payload_mock.read.return_value = json.dumps({"from": FunctionName})
+            return {"Payload": payload_mock}
+
+        lambda_client_mock.invoke.side_effect = invoke
+
+        results = self.handler.invoke_lambdas(
+            [("fn-a", {"key": "a"}), ("fn-b", None), ("fn-c", "text")]
+        )
+
+        assert results == [{"from": "fn-a"}, {"from": "fn-b"}, {"from": "fn-c"}]
+        mock_boto3_client.assert_called_once()
+        assert lambda_client_mock.invoke.call_count == 3
+        assert self.handler.invoke_lambdas([]) == []
+
+    @patch("boto3.client")
+    def test_invoke_lambda_large_integer_payload(self, mock_boto3_client):
+        """
+        Test that large integers in the response payload are kept exact.
+        """
+        payload_mock = MagicMock()
+        payload_mock.read.return_value = b'{"id": 123456789012345678901234567890}'
+        mock_boto3_client.return_value.invoke.return_value = {"Payload": payload_mock}
+
+        response = self.handler.invoke_lambda("test_lambda_function")
+
+        assert response == {"id": 123456789012345678901234567890}
+
     @patch("boto3.client")
     def test_invoke_lambda_empty_function_name(self, mock_boto3_client):
         """
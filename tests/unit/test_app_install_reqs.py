@@ -0,0 +1,29 @@
+"""
+Unit tests for app_install_reqs module.
+"""
+
+from unittest.mock import Mock
+
+from app_scripts.app_install_reqs import _precompile_packages
+
+
+def test_precompile_packages():
+    """Test that packages are force-compiled to unchecked hash-based .pyc files."""
+    mock_log = Mock()
+    mock_run = Mock()
+
+    _precompile_packages(mock_log, mock_run, "lambda/packages")
+
+    mock_run.assert_called_once_with(
+        [
+            "python3.11",
+            "-m",
+            "compileall",
+            "-q",
+            "-f",
+            "--invalidation-mode",
+            "unchecked-hash",
+            "lambda/packages",
+        ]
+    )
+    mock_log.assert_called_once_with("*** Precompiled lambda/packages.")